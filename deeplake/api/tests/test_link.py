@@ -658,6 +658,22 @@ def test_rgb_gray(local_ds, cat_path, hopper_gray_path):
         assert len(ds.abc[1].numpy().shape) == 3
 
 
+def test_link_image_slices(local_ds, cat_path, hopper_gray_path):
+    with local_ds as ds:
+        ds.create_tensor("abc", "link[image]", sample_compression="jpeg")
+        ds.abc.extend([deeplake.link(cat_path), deeplake.link(hopper_gray_path)])
+
+    for i in range(2):
+        full = ds.abc[i].numpy()
+        np.testing.assert_array_equal(ds.abc[i][10:50].numpy(), full[10:50])
+        np.testing.assert_array_equal(
+            ds.abc[i][10:50, 20:60].numpy(), full[10:50, 20:60]
+        )
+        np.testing.assert_array_equal(ds.abc[i][-5, 3:7].numpy(), full[-5, 3:7])
+        np.testing.assert_array_equal(ds.abc[i][5:9, 3, 0].numpy(), full[5:9, 3, 0])
+        np.testing.assert_array_equal(ds.abc[i][::2, 5:9].numpy(), full[::2, 5:9])
+
+
 @pytest.mark.slow
 def test_creds(hub_cloud_ds_generator, cat_path):
     creds_key = "ENV"
@@ -116,3 +116,36 @@ def test_polygon_transform_bug(local_ds):
     ds2.create_tensor("p3", htype="polygon", chunk_compression="lz4")
 
     upload().eval(ds, ds2, num_workers=2)
+
+
+@pytest.mark.parametrize(
+    "args", [{}, {"sample_compression": "lz4"}, {"chunk_compression": "lz4"}]
+)
+def test_polygon_append_after_read(memory_ds, args):
+    arr1 = np.random.randint(0, 10, (3, 3, 2))
+    arr2 = np.random.randint(0, 10, (3, 3, 2))
+    with memory_ds as ds:
+        ds.create_tensor("polygons", htype="polygon", **args)
+        ds.polygons.append(arr1)
+        held = ds.polygons[0].numpy()
+        ds.polygons.append(arr2)
+    np.testing.assert_array_equal(held, arr1)
+    np.testing.assert_array_equal(ds.polygons[0].numpy(), arr1)
+    np.testing.assert_array_equal(ds.polygons[1].numpy(), arr2)
+
+
+@pytest.mark.parametrize(
+    "args", [{}, {"sample_compression": "lz4"}, {"chunk_compression": "lz4"}]
+)
+def test_polygon_mutate_after_read(memory_ds, args):
+    arr = np.random.randint(0, 10, (3, 3, 2))
+    with memory_ds as ds:
+        ds.create_tensor("polygons", htype="polygon", **args)
+        ds.polygons.append(arr)
+        held = ds.polygons[0].numpy()
+        if held[0].flags["WRITEABLE"]:
+            held[0][0, 0] = 42
+        else:
+            with pytest.raises(ValueError):
+                held[0][0, 0] = 42
+    np.testing.assert_array_equal(ds.polygons[0].numpy(), arr)
@@ -348,6 +348,21 @@ class BaseChunk(DeepLakeMemoryObject):
                 incoming_sample, shape = serialize_text(
                     incoming_sample, sample_compression, dt, ht  # type: ignore
                 )
+        # the most common samples, checked before the other sample types
+        elif isinstance(
+            incoming_sample,
+            (np.ndarray, list, int, float, bool, np.integer, np.floating, np.bool_),
+        ):
+            incoming_sample, shape = serialize_numpy_and_base_types(
+                incoming_sample,
+                sample_compression,
+                chunk_compression,
+                dt,
+                ht,
+                tiling_threshold,
+                break_into_tiles,
+                store_uncompressed_tiles,
+            )
         elif incoming_sample is None:
             shape = (0,) * self.num_dims if self.num_dims else None
             incoming_sample = b""
@@ -382,20 +397,6 @@ class BaseChunk(DeepLakeMemoryObject):
                 break_into_tiles,
                 store_uncompressed_tiles,
             )
-        elif isinstance(
-            incoming_sample,
-            (np.ndarray, list, int, float, bool, np.integer, np.floating, np.bool_),
-        ):
-            incoming_sample, shape = serialize_numpy_and_base_types(
-                incoming_sample,
-                sample_compression,
-                chunk_compression,
-                dt,
-                ht,
-                tiling_threshold,
-                break_into_tiles,
-                store_uncompressed_tiles,
-            )
         elif isinstance(incoming_sample, SampleTiles):
             shape = incoming_sample.sample_shape
         elif isinstance(incoming_sample, Polygons):
@@ -521,6 +522,8 @@ class BaseChunk(DeepLakeMemoryObject):
         if not old_data or self.byte_positions_encoder.is_empty():  # tiled sample
             return new_sample_bytes
         old_start_byte, old_end_byte = self.byte_positions_encoder[local_index]
+        # memoryview slices so that old data is copied only once, into new_data
+        old_data = memoryview(old_data)
         left_data = old_data[:old_start_byte]  # type: ignore
         right_data = old_data[old_end_byte:]  # type: ignore
 
@@ -585,7 +588,12 @@ class BaseChunk(DeepLakeMemoryObject):
     def pop(self, index):
         self.prepare_for_write()
         sb, eb = self.byte_positions_encoder[index]
-        self.data_bytes = self.data_bytes[:sb] + self.data_bytes[eb:]
+        # preallocate and copy both halves once instead of slicing and concatenating
+        data = memoryview(self.data_bytes)
+        new_data = bytearray(len(data) - (eb - sb))
+        new_data[:sb] = data[:sb]
+        new_data[sb:] = data[eb:]
+        self.data_bytes = new_data
         if not self.shapes_encoder.is_empty():
             self.shapes_encoder.pop(index)
         if not self.byte_positions_encoder.is_empty():
@@ -635,6 +643,13 @@ class BaseChunk(DeepLakeMemoryObject):
         return state
 
 
+def remove_skipped_samples(samples: List, skipped: List[int]) -> None:
+    """Removes the samples at the given indices in place, in a single pass over the list."""
+    if skipped:
+        skipped_set = set(skipped)
+        samples[:] = [s for i, s in enumerate(samples) if i not in skipped_set]
+
+
 def catch_chunk_read_error(fn):
     @wraps(fn)
     def wrapper(self, *args, **kwargs):
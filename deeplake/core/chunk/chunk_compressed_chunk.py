@@ -15,7 +15,12 @@ from deeplake.core.polygon import Polygons
 from deeplake.util.casting import intelligent_cast
 from deeplake.util.compression import get_compression_ratio
 from deeplake.util.exceptions import TensorDtypeMismatchError
-from .base_chunk import BaseChunk, InputSample, catch_chunk_read_error
+from .base_chunk import (
+    BaseChunk,
+    InputSample,
+    catch_chunk_read_error,
+    remove_skipped_samples,
+)
 from deeplake.core.serialize import infer_chunk_num_bytes
 from deeplake.constants import ENCODING_DTYPE
 import deeplake
@@ -301,8 +306,7 @@ class ChunkCompressedChunk(BaseChunk):
             )
             num_samples += 1
 
-        for i in reversed(skipped):
-            incoming_samples.pop(i)
+        remove_skipped_samples(incoming_samples, skipped)
         return num_samples
 
     def extend_if_has_space_image_compression(
@@ -376,8 +380,7 @@ class ChunkCompressedChunk(BaseChunk):
             )
             num_samples += 1
 
-        for i in reversed(skipped):
-            incoming_samples.pop(i)
+        remove_skipped_samples(incoming_samples, skipped)
         return num_samples
 
     def _get_partial_sample_tile(self, as_bytes=None):
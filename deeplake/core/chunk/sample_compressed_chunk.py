@@ -1,5 +1,6 @@
 import os
 import struct
+import numpy as np
 from typing import List, Optional, Union
 from deeplake.core.compression import decompress_array, decompress_bytes
 from deeplake.core.sample import Sample  # type: ignore
@@ -10,10 +11,21 @@ from deeplake.core.serialize import (
 from deeplake.core.tiling.sample_tiles import SampleTiles
 from deeplake.core.polygon import Polygons
 from deeplake.util.video import normalize_index
-from .base_chunk import BaseChunk, InputSample, catch_chunk_read_error
+from .base_chunk import (
+    BaseChunk,
+    InputSample,
+    catch_chunk_read_error,
+    remove_skipped_samples,
+)
 
 
 class SampleCompressedChunk(BaseChunk):
+    def __init__(self, *args, **kwargs):
+        super(SampleCompressedChunk, self).__init__(*args, **kwargs)
+        # Raw and compressed sizes of the arrays written to this chunk.
+        self._raw_nbytes_written = 0
+        self._compressed_nbytes_written = 0
+
     def extend_if_has_space(self, incoming_samples: List[InputSample], update_tensor_meta: bool = True, ignore_errors: bool = False, **kwargs) -> float:  # type: ignore
         self.prepare_for_write()
         num_samples: float = 0
@@ -21,9 +33,26 @@ class SampleCompressedChunk(BaseChunk):
         compr = self.compression
         skipped: List[int] = []
 
+        # bound once, these are looked up for every sample otherwise
+        serialize_sample = self.serialize_sample
+        can_fit_sample = self.can_fit_sample
+        register_in_meta_and_headers = self.register_in_meta_and_headers
+        # grown in place, so that the chunk's own buffer is never reassigned in the loop
+        data_bytes = self.data_bytes
+        if not isinstance(data_bytes, bytearray):
+            data_bytes = self.data_bytes = bytearray(data_bytes)  # type: ignore
+        is_empty = self.is_empty
+
         for i, incoming_sample in enumerate(incoming_samples):
+            is_array = isinstance(incoming_sample, np.ndarray)
+            if (
+                is_array
+                and not is_empty
+                and self._will_not_fit(incoming_sample.nbytes)  # type: ignore
+            ):
+                break
             try:
-                serialized_sample, shape = self.serialize_sample(incoming_sample, compr)
+                serialized_sample, shape = serialize_sample(incoming_sample, compr)
                 if shape is not None:
                     self.num_dims = self.num_dims or len(shape)
                     check_sample_shape(shape, self.num_dims)
@@ -35,22 +64,26 @@ class SampleCompressedChunk(BaseChunk):
 
             if isinstance(serialized_sample, SampleTiles):
                 incoming_samples[i] = serialized_sample  # type: ignore
-                if self.is_empty:
+                if is_empty:
                     self.write_tile(serialized_sample)
                     num_samples += 0.5
                 break
 
             else:
                 sample_nbytes = len(serialized_sample)
-                if self.is_empty or self.can_fit_sample(sample_nbytes):
-                    self.data_bytes += serialized_sample  # type: ignore
+                if is_empty or can_fit_sample(sample_nbytes):
+                    data_bytes += serialized_sample  # type: ignore
 
-                    self.register_in_meta_and_headers(
+                    register_in_meta_and_headers(
                         sample_nbytes,
                         shape,
                         update_tensor_meta=update_tensor_meta,
                     )
+                    is_empty = False
                     num_samples += 1
+                    if is_array:
+                        self._raw_nbytes_written += incoming_sample.nbytes  # type: ignore
+                        self._compressed_nbytes_written += sample_nbytes
                 else:
                     if serialized_sample:
                         path = None
@@ -68,10 +101,25 @@ class SampleCompressedChunk(BaseChunk):
                         incoming_samples[i] = sample
                     break
 
-        for i in reversed(skipped):
-            incoming_samples.pop(i)
+        remove_skipped_samples(incoming_samples, skipped)
         return num_samples
 
+    def _will_not_fit(self, raw_nbytes: int) -> bool:
+        """Estimates the compressed size of an array from the arrays already in this chunk, so that compressing it
+        can be skipped when it is clearly too big for the space left. Only done for nearly full chunks.
+        """
+        # samples are added until min_chunk_size is reached, see can_fit_sample
+        if (
+            not self._raw_nbytes_written
+            or self.num_data_bytes <= 0.95 * self.min_chunk_size
+        ):
+            return False
+        estimate = (
+            raw_nbytes * self._compressed_nbytes_written / self._raw_nbytes_written
+        )
+        # compression ratios vary between samples, only skip when well past the limit
+        return estimate > 2 * (self.min_chunk_size - self.num_data_bytes)
+
     @catch_chunk_read_error
     def read_sample(  # type: ignore
         self,
@@ -125,7 +173,6 @@ class SampleCompressedChunk(BaseChunk):
         nframes = shape[0]
         if self.is_text_like:
             buffer = decompress_bytes(buffer, compression=self.compression)
-            buffer = bytes(buffer)
             return bytes_to_text(buffer, self.htype)
 
         squeeze = isinstance(sub_index, int)
@@ -138,7 +185,7 @@ class SampleCompressedChunk(BaseChunk):
         if self.tensor_meta.htype == "polygon":
             buffer = decompress_bytes(buffer, self.compression)
             return Polygons.frombuffer(
-                bytes(buffer),
+                buffer,
                 dtype=self.tensor_meta.dtype,
                 ndim=shape[-1],
             )
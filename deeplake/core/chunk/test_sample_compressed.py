@@ -46,6 +46,44 @@ def test_read_write_sequence(compression):
         data_in2 = data_in2[num_samples:]
 
 
+@compressions_paremetrized
+def test_skip_compression_on_full_chunk(compression):
+    tensor_meta = create_tensor_meta()
+    common_args["tensor_meta"] = tensor_meta
+    common_args["compression"] = compression
+    dtype = tensor_meta.dtype
+    # fills more than 95% of min_chunk_size
+    data_in = [
+        np.random.rand(240, 350, 3).astype(dtype),
+        np.random.rand(250, 160, 3).astype(dtype),
+    ]
+    chunk = SampleCompressedChunk(**common_args)
+    assert chunk.extend_if_has_space(data_in) == 1
+    assert chunk.num_data_bytes > 0.95 * chunk.min_chunk_size
+    # the last sample is clearly too big for the space left, so it isn't compressed
+    assert isinstance(data_in[1], np.ndarray)
+
+    chunk = SampleCompressedChunk(**common_args)
+    assert chunk.extend_if_has_space(data_in[1:]) == 1
+    np.testing.assert_array_equal(chunk.read_sample(0), data_in[1])
+
+
+@compressions_paremetrized
+def test_no_skip_on_mostly_empty_chunk(compression):
+    tensor_meta = create_tensor_meta()
+    common_args["tensor_meta"] = tensor_meta
+    common_args["compression"] = compression
+    dtype = tensor_meta.dtype
+    # an incompressible sample followed by a large but compressible one
+    data_in = [
+        np.random.rand(250, 160, 3).astype(dtype),
+        np.zeros((400, 400, 3), dtype=dtype),
+    ]
+    chunk = SampleCompressedChunk(**common_args)
+    assert chunk.extend_if_has_space(data_in) == 2
+    np.testing.assert_array_equal(chunk.read_sample(1), data_in[1])
+
+
 @pytest.mark.slow
 @compressions_paremetrized
 def test_read_write_sequence_big(cat_path, compression):
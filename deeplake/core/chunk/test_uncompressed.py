@@ -147,3 +147,24 @@ def test_update():
             np.testing.assert_array_equal(chunk.read_sample(i), data_5)
         else:
             np.testing.assert_array_equal(chunk.read_sample(i), data_in[i])
+
+
+def test_read_fixed_shape_samples(local_ds):
+    with local_ds as ds:
+        ds.create_tensor("abc", max_chunk_size=2 * 4 * 5 * 4 * 10)
+        ds.abc.extend(np.arange(50 * 4 * 5, dtype="int32").reshape(50, 4, 5))
+
+    engine = ds.abc.chunk_engine
+    assert not engine.is_data_cachable
+    chunk = engine.get_chunk_from_chunk_id(engine.chunk_id_encoder[0][0])
+    samples = chunk.read_fixed_shape_samples()
+    assert samples.shape == (chunk.num_samples, 4, 5)
+    for i in range(chunk.num_samples):
+        np.testing.assert_array_equal(samples[i], chunk.read_sample(i))
+
+    idxs = [3, 0, 27, 49, 12, 3]
+    expected = np.stack([ds.abc[i].numpy() for i in idxs])
+    np.testing.assert_array_equal(ds.abc[idxs].numpy(fetch_chunks=True), expected)
+    np.testing.assert_array_equal(
+        ds.abc[idxs, 1:3, 4].numpy(fetch_chunks=True), expected[:, 1:3, 4]
+    )
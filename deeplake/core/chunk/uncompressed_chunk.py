@@ -10,7 +10,12 @@ from deeplake.core.tiling.sample_tiles import SampleTiles
 from deeplake.core.polygon import Polygons
 from deeplake.util.exceptions import TensorDtypeMismatchError
 from deeplake.constants import ENCODING_DTYPE
-from .base_chunk import BaseChunk, InputSample, catch_chunk_read_error
+from .base_chunk import (
+    BaseChunk,
+    InputSample,
+    catch_chunk_read_error,
+    remove_skipped_samples,
+)
 
 
 class UncompressedChunk(BaseChunk):
@@ -194,8 +199,7 @@ class UncompressedChunk(BaseChunk):
                 else:
                     break
 
-        for i in reversed(skipped):
-            incoming_samples.pop(i)
+        remove_skipped_samples(incoming_samples, skipped)
         return num_samples
 
     @catch_chunk_read_error
@@ -253,13 +257,34 @@ class UncompressedChunk(BaseChunk):
                 buffer = bytes(buffer)
             return buffer
         if self.is_text_like:
-            buffer = bytes(buffer)
             return bytes_to_text(buffer, self.htype)
         ret = np.frombuffer(buffer, dtype=self.dtype).reshape(shape)
         if copy and not ret.flags["WRITEABLE"]:
             ret = ret.copy()
         return ret
 
+    @catch_chunk_read_error
+    def read_fixed_shape_samples(self) -> Optional[np.ndarray]:
+        """Returns a ``(num_samples, *shape)`` view over every sample in the chunk, without copying.
+        Returns ``None`` if the samples can't be read this way, in which case ``read_sample`` should be used instead.
+        """
+        self.check_empty_before_read()
+        if (
+            not self.is_fixed_shape
+            or self.is_partially_read_chunk
+            or self.tensor_meta.is_link
+            or self.htype == "polygon"
+        ):
+            return None
+        sample_size = self.sample_size
+        num_bytes = len(self.memoryview_data)
+        if not sample_size or not num_bytes or num_bytes % sample_size:
+            return None
+        shape = tuple(self.tensor_meta.min_shape)
+        return np.frombuffer(self.memoryview_data, dtype=self.dtype).reshape(
+            (num_bytes // sample_size,) + shape
+        )
+
     def update_sample(self, local_index: int, sample: InputSample):
         self.prepare_for_write()
         serialized_sample, shape = self.serialize_sample(sample, break_into_tiles=False)
@@ -1350,6 +1350,7 @@ class ChunkEngine:
             [v.value for v in index.values[1:]], sample_shape, tile_shape  # type: ignore
         )
         required_tile_ids = ordered_tile_ids[tiles_index]
+        self._prefetch_chunks(required_tile_ids.ravel())
         tiles = np.vectorize(
             lambda chunk_id: self.get_chunk_from_chunk_id(
                 chunk_id, copy=True
@@ -2034,6 +2035,18 @@ class ChunkEngine:
         chunk = self.get_chunk_from_chunk_id(
             chunk_id, partial_chunk_bytes=worst_case_header_size
         )
+        return self._read_basic_sample(
+            chunk, local_sample_index, index, is_tile=is_tile, decompress=decompress
+        )
+
+    def _read_basic_sample(
+        self,
+        chunk: BaseChunk,
+        local_sample_index: int,
+        index: Index,
+        is_tile: bool = False,
+        decompress: bool = True,
+    ):
         decompress = decompress or (
             isinstance(chunk, ChunkCompressedChunk) or len(index) > 1
         )
@@ -2107,6 +2120,7 @@ class ChunkEngine:
             [v.value for v in index.values[1:]], sample_shape, tile_shape  # type: ignore
         )
         required_tile_ids = ordered_tile_ids[tiles_index]
+        self._prefetch_chunks(required_tile_ids.ravel())
         tiles = np.vectorize(
             lambda chunk_id: self.get_chunk_from_chunk_id(chunk_id).read_sample(
                 0, is_tile=True
@@ -2285,16 +2299,31 @@ class ChunkEngine:
         """
         samples = {}
         last_shape = None
+        num_samples = self.num_samples
+        # the chunk and its first global index are resolved once and shared by all samples in it
+        chunk = None
+        fixed_shape_samples = None
+        first_idx = (
+            0 if row == 0 else self.chunk_id_encoder.array[row - 1][-1].item() + 1
+        )
+        sub_index = tuple(entry.value for entry in index.values[1:])
 
         for idx in idxs:
             if idx in samples:
                 continue
             try:
-                if not self._is_tiled_sample(idx) and idx < self.num_samples:
-                    local_idx = self.translate_to_local_index(idx, row)
-                    sample = self.read_basic_sample_from_chunk(
-                        chunk_id, local_idx, index
-                    )
+                if not self._is_tiled_sample(idx) and idx < num_samples:
+                    local_idx = idx - first_idx
+                    if chunk is None:
+                        chunk = self.get_chunk_from_chunk_id(chunk_id)
+                        if isinstance(chunk, UncompressedChunk):
+                            fixed_shape_samples = chunk.read_fixed_shape_samples()
+                    if fixed_shape_samples is not None:
+                        sample = fixed_shape_samples[local_idx]
+                        if sub_index:
+                            sample = sample[sub_index]
+                    else:
+                        sample = self._read_basic_sample(chunk, local_idx, index)
                 else:
                     sample = self.get_single_sample(idx, index, pad_tensor=pad_tensor)
             except GetChunkError as e:
@@ -2452,7 +2481,11 @@ class ChunkEngine:
                     full_shape = (num_samples,) + tuple(self.tensor_meta.max_shape)
                     dtype = self.tensor_meta.dtype
 
-                    data_bytes = bytearray(chunk.data_bytes)
+                    data_bytes = chunk.data_bytes
+                    # chunks read from storage hold a memoryview that is never resized, so it can be viewed as is.
+                    # a bytearray can still grow on the next write, which fails while a numpy view exports it.
+                    if not isinstance(data_bytes, memoryview):
+                        data_bytes = bytearray(data_bytes)
                     self.cached_data = np.frombuffer(data_bytes, dtype).reshape(
                         full_shape
                     )
@@ -2479,10 +2512,28 @@ class ChunkEngine:
         Returns:
             List[BaseChunk]: BaseChunk objects that contains `global_sample_index`.
         """
-        return [
-            self.get_chunk_from_chunk_id(chunk_id, copy)
-            for chunk_id in self.chunk_id_encoder[global_sample_index]
-        ]
+        chunk_ids = self.chunk_id_encoder[global_sample_index]
+        self._prefetch_chunks(chunk_ids)
+        return [self.get_chunk_from_chunk_id(chunk_id, copy) for chunk_id in chunk_ids]
+
+    def _prefetch_chunks(self, chunk_ids) -> None:
+        """Loads the chunks that are not already in cache from storage in a single batch.
+        Used for samples spanning multiple chunks, so that the chunks are not fetched one round trip at a time.
+        """
+        num_chunks = len(chunk_ids)
+        # skip if the chunks can't all stay in cache until they are read
+        if num_chunks < 2 or num_chunks * self.max_chunk_size > self.cache.cache_size:
+            return
+        chunk_keys = []
+        for chunk_id in chunk_ids:
+            chunk_name = ChunkIdEncoder.name_from_id(chunk_id)
+            chunk_commit_id, tkey = self.get_chunk_commit(chunk_name)
+            chunk_key = get_chunk_key(tkey, chunk_name, chunk_commit_id)
+            if self.cache._get_item_from_cache(chunk_key) is None:
+                chunk_keys.append(chunk_key)
+        if len(chunk_keys) > 1:
+            for _ in self.cache.get_items(chunk_keys):
+                pass
 
     def validate_num_samples_is_synchronized(self):
         """Check if tensor meta length and chunk ID encoder are representing the same number of samples.
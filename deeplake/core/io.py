@@ -355,6 +355,8 @@ class SampleStreaming(Streaming):
             self.ndim_dict,
             self.tensor_info_dict,
         )
+        # every index in a block reads from the same chunks, so they are only resolved once per block
+        block_chunks: Dict[int, List[BaseChunk]] = {}
         for idx in block.indices():
             sample = dict()
             valid_sample_flag = True
@@ -363,37 +365,18 @@ class SampleStreaming(Streaming):
                 rel_key = key[self._group_index_length :]
                 decompress = key not in self.raw_tensors
                 to_pil = key in self.pil_compressed_tensors
-                chunk_class = engine.chunk_class
                 try:
-                    chunks: List[BaseChunk] = []
                     c_names = block.chunk_names(keyid)
                     if c_names == [None]:
                         sample[rel_key] = engine.get_empty_sample()
                         continue
-                    for c_name in c_names:
-                        commit_id, tkey = engine.get_chunk_commit(c_name)
-                        c_key = get_chunk_key(
-                            tkey,
-                            c_name,  # type: ignore
-                            commit_id,
-                        )
-                        if self.local_caches is not None:
-                            local_cache = self.local_caches[key]
-
-                            if c_key in local_cache:
-                                chunk = local_cache.get_deeplake_object(c_key, chunk_class, meta=engine.chunk_args)  # type: ignore
-                            else:
-                                chunk = engine.get_chunk(c_key)
-                                local_cache[c_key] = chunk
-
-                                # send data to actual storage
-                                local_cache._forward(c_key)
-                        else:
-                            chunk = engine.get_chunk(c_key)
-                        chunks.append(chunk)
+                    chunks = block_chunks.get(keyid)
+                    if chunks is None:
+                        chunks = self._get_chunks(key, engine, c_names)
+                        block_chunks[keyid] = chunks
                     if len(chunks) == 1:
                         data = engine.read_sample_from_chunk(
-                            idx, chunk, decompress=decompress, to_pil=to_pil
+                            idx, chunks[0], decompress=decompress, to_pil=to_pil
                         )
                     else:
                         if not decompress:
@@ -424,6 +407,33 @@ class SampleStreaming(Streaming):
                     )
                 yield sample
 
+    def _get_chunks(
+        self, key: str, engine: ChunkEngine, c_names: List[Optional[str]]
+    ) -> List[BaseChunk]:
+        chunks: List[BaseChunk] = []
+        for c_name in c_names:
+            commit_id, tkey = engine.get_chunk_commit(c_name)
+            c_key = get_chunk_key(
+                tkey,
+                c_name,  # type: ignore
+                commit_id,
+            )
+            if self.local_caches is not None:
+                local_cache = self.local_caches[key]
+
+                if c_key in local_cache:
+                    chunk = local_cache.get_deeplake_object(c_key, engine.chunk_class, meta=engine.chunk_args)  # type: ignore
+                else:
+                    chunk = engine.get_chunk(c_key)
+                    local_cache[c_key] = chunk
+
+                    # send data to actual storage
+                    local_cache._forward(c_key)
+            else:
+                chunk = engine.get_chunk(c_key)
+            chunks.append(chunk)
+        return chunks
+
     def _get_block_for_single_sample(self, idx):
         chunks = []
         for engine in self.chunk_engines.values():
@@ -1,4 +1,5 @@
 import deeplake
+from deeplake.compression import IMAGE_COMPRESSION, get_compression_type
 from deeplake.core.chunk.base_chunk import BaseChunk
 from deeplake.core.chunk_engine import ChunkEngine
 from deeplake.core.chunk.uncompressed_chunk import UncompressedChunk
@@ -32,6 +33,10 @@ from deeplake.core.linked_tiled_sample import LinkedTiledSample
 from math import ceil
 
 
+# image compressions that are not decoded by PIL
+_NON_PIL_IMAGE_COMPRESSIONS = {"dcm", "apng"}
+
+
 def remove_chunk_engine_compression(chunk_engine):
     chunk_engine.chunk_class = UncompressedChunk
     chunk_engine.compression = None
@@ -220,11 +225,53 @@ class LinkedChunkEngine(ChunkEngine):
         sample = self.get_deeplake_read_sample(global_sample_index, fetch_chunks)
         if sample is None:
             return np.ones((0,))
-        arr = sample.array
+        sub_index = tuple(entry.value for entry in index.values[1:])
+        arr = self._read_cropped_image(sample, sub_index)
+        if arr is None:
+            arr = sample.array
+        else:
+            sub_index = (
+                tuple(0 if isinstance(v, int) else slice(None) for v in sub_index[:2])
+                + sub_index[2:]
+            )
         max_shape = self.tensor_meta.max_shape
         if len(arr.shape) == 2 and max_shape and len(max_shape) == 3:
             arr = arr.reshape(arr.shape + (1,))
-        return arr[tuple(entry.value for entry in index.values[1:])]
+        return arr[sub_index]
+
+    def _read_cropped_image(self, sample, sub_index) -> Optional[np.ndarray]:
+        """Crops the image to the requested rows and columns before converting it to numpy, so that only the
+        requested window is copied out of the decoded image. Returns None if the sample or index can't be cropped.
+        """
+        if not sub_index or len(sub_index) > 3:
+            return None
+        compression = sample.compression
+        if (
+            get_compression_type(compression) != IMAGE_COMPRESSION
+            or compression in _NON_PIL_IMAGE_COMPRESSIONS
+        ):
+            return None
+        shape = sample.shape
+        if len(shape) < 2:
+            return None
+        bounds = []
+        for value, dim in zip(sub_index[:2], shape[:2]):
+            if isinstance(value, slice):
+                start, stop, step = value.indices(dim)
+                if step != 1 or start >= stop:
+                    return None
+            elif isinstance(value, int) and -dim <= value < dim:
+                start = value % dim
+                stop = start + 1
+            else:
+                return None
+            bounds.append((start, stop))
+        if len(bounds) == 1:
+            bounds.append((0, shape[1]))
+        (top, bottom), (left, right) = bounds
+        if bottom - top == shape[0] and right - left == shape[1]:
+            return None
+        return np.array(sample.pil.crop((left, top, right, bottom)))
 
     def get_path(self, global_sample_index, fetch_chunks=False) -> str:
         return super().get_basic_sample(
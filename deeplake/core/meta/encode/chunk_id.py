@@ -103,7 +103,7 @@ class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
     def generate_chunk_id(
         self, register: Optional[bool] = True, row: Optional[int] = None
     ):
-        """Generates a random 64bit chunk ID using uuid4. Also prepares this ID to have samples registered to it.
+        """Generates a random chunk ID of `self.dtype`'s width using os.urandom. Also prepares this ID to have samples registered to it.
         This method should be called once per chunk created.
 
         Args:
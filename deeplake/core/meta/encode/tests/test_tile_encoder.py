@@ -0,0 +1,29 @@
+from deeplake.core.meta.encode.tile import TileEncoder
+
+
+def test_serialization():
+    enc = TileEncoder()
+    assert TileEncoder.frombuffer(enc.tobytes()).entries == {}
+
+    entries = {
+        0: ((1000, 500, 100, 3), (10, 10, 10, 3)),
+        7: ((3000, 600, 100, 4), (50, 50, 50, 4)),
+    }
+    enc = TileEncoder(dict(entries))
+    buffer = enc.tobytes()
+    assert len(buffer) == enc.nbytes
+
+    dec = TileEncoder.frombuffer(buffer)
+    assert dec.entries == entries
+    assert dec.version == enc.version
+    assert dec.get_tile_layout_shape(7) == (60, 12, 2, 1)
+
+
+def test_legacy_big_endian():
+    entries = {3: ((20, 30), (10, 10)), 12: ((40, 5), (8, 5))}
+    data = bytearray(len(entries).to_bytes(8, "big") + (2).to_bytes(8, "big"))
+    for key, (sample_shape, tile_shape) in entries.items():
+        for value in (key, *sample_shape, *tile_shape):
+            data += value.to_bytes(8, "big")
+
+    assert TileEncoder.frombuffer(bytes(data)).entries == entries
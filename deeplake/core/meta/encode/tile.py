@@ -1,6 +1,6 @@
 import deeplake
 import numpy as np
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
 from deeplake.core.tiling.sample_tiles import SampleTiles
 
@@ -138,23 +138,12 @@ class TileEncoder(DeepLakeMemoryObject):
         data[ofs : ofs + 8] = num_dimensions.to_bytes(8, byteorder="little")
         ofs += 8
 
-        # store the entries
-        for key, value in entries.items():
-            # store the key
-            data[ofs : ofs + 8] = key.to_bytes(8, byteorder="little")
-            ofs += 8
-
-            # store the first shape
-            first_shape = value[0]
-            for dimension in first_shape:
-                data[ofs : ofs + 8] = dimension.to_bytes(8, byteorder="little")
-                ofs += 8
-
-            # store the second shape
-            second_shape = value[1]
-            for dimension in second_shape:
-                data[ofs : ofs + 8] = dimension.to_bytes(8, byteorder="little")
-                ofs += 8
+        # store the entries, one row of key, first shape and second shape per entry
+        rows = np.array(
+            [(key, *value[0], *value[1]) for key, value in entries.items()],
+            dtype="<u8",
+        )
+        data[ofs:] = rows.tobytes()
 
         return memoryview(data)
 
@@ -198,21 +187,13 @@ def parse_tile_encoder_entries(data, ofs: int, byteorder: str) -> Dict:
     num_dim = int.from_bytes(data[ofs : ofs + 8], byteorder=byteorder)  # type: ignore
     ofs += 8
 
-    # Get the entries
-    entries = {}
-    for _ in range(num_entries):
-        # Get the key
-        key = int.from_bytes(data[ofs : ofs + 8], byteorder=byteorder)  # type: ignore
-        ofs += 8
-
-        first_shape: List[int] = []
-        second_shape: List[int] = []
-
-        for shp in [first_shape, second_shape]:
-            for _ in range(num_dim):
-                shp.append(int.from_bytes(data[ofs : ofs + 8], byteorder=byteorder))  # type: ignore
-                ofs += 8
-
-        # Add the entry to the dict
-        entries[key] = (tuple(first_shape), tuple(second_shape))
-    return entries
+    # Get the entries, each is a row of key, first shape and second shape
+    width = 1 + 2 * num_dim
+    dtype = np.dtype("<u8" if byteorder == "little" else ">u8")
+    rows = np.frombuffer(
+        data, dtype=dtype, count=num_entries * width, offset=ofs
+    ).reshape(num_entries, width)
+    return {
+        row[0]: (tuple(row[1 : num_dim + 1]), tuple(row[num_dim + 1 :]))
+        for row in rows.tolist()
+    }
@@ -348,8 +348,7 @@ class Sample:
             if self.is_text_like:
                 from deeplake.core.serialize import bytes_to_text
 
-                buffer = bytes(self._buffer)
-                self._array = bytes_to_text(buffer, self.htype)
+                self._array = bytes_to_text(self._buffer, self.htype)
             else:
                 try:
                     self._array = np.frombuffer(self._buffer, dtype=self.dtype).reshape(
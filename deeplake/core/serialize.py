@@ -475,18 +475,19 @@ def text_to_bytes(sample, dtype, htype):
 
 
 def bytes_to_text(buffer, htype):
-    buffer = bytes(buffer)
+    # decode straight from the buffer, memoryviews don't need to be copied into bytes first
+    text = str(buffer, "utf-8")
     if htype == "json":
         arr = np.empty(1, dtype=object)
-        arr[0] = json.loads(bytes.decode(buffer), cls=HubJsonDecoder)
+        arr[0] = json.loads(text, cls=HubJsonDecoder)
         return arr
     elif htype in ("list", "tag"):
-        lst = json.loads(bytes.decode(buffer), cls=HubJsonDecoder)
+        lst = json.loads(text, cls=HubJsonDecoder)
         arr = np.empty(len(lst), dtype=object)
         arr[:] = lst
         return arr
     else:  # htype == "text":
-        arr = np.array(bytes.decode(buffer)).reshape(
+        arr = np.array(text).reshape(
             1,
         )
     return arr
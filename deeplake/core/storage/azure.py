@@ -300,19 +300,6 @@ class AzureProvider(StorageProvider):
         from azure.storage.blob import BlobSasPermissions, generate_blob_sas  # type: ignore
 
         self._check_update_creds()
-        if full:
-            blob_client, blob_service_client = self.get_clients_from_full_path(path)
-            account_name = blob_client.account_name
-            container_name = blob_client.container_name
-            blob_path = blob_client.blob_name
-            account_url = f"https://{account_name}.blob.core.windows.net"
-        else:
-            blob_service_client = self.blob_service_client
-            account_name = self.account_name
-            container_name = self.container_name
-            blob_path = f"{self.root_folder}/{path}"
-            account_url = self.account_url
-
         url = None
         cached = self._presigned_urls.get(path)
         if cached:
@@ -329,6 +316,22 @@ class AzureProvider(StorageProvider):
                 org_id, ds_name = self.tag.split("/")  # type: ignore
                 url = client.get_presigned_url(org_id, ds_name, path)
             else:
+                # resolved only on a cache miss, checking a full path's blob is a request
+                if full:
+                    blob_client, blob_service_client = self.get_clients_from_full_path(
+                        path
+                    )
+                    account_name = blob_client.account_name
+                    container_name = blob_client.container_name
+                    blob_path = blob_client.blob_name
+                    account_url = f"https://{account_name}.blob.core.windows.net"
+                else:
+                    blob_service_client = self.blob_service_client
+                    account_name = self.account_name
+                    container_name = self.container_name
+                    blob_path = f"{self.root_folder}/{path}"
+                    account_url = self.account_url
+
                 if not isinstance(self.credential, AzureSasCredential):
                     user_delegation_key = blob_service_client.get_user_delegation_key(
                         datetime.now(timezone.utc),
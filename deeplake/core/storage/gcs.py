@@ -321,7 +321,8 @@ class GCSProvider(StorageProvider):
             self.path += "/"
 
     def _get_path_from_key(self, key):
-        return posixpath.join(self.path, key)
+        # self.path always ends with "/", plain concatenation is enough and cheaper than posixpath.join
+        return "".join((self.path, key))
 
     def _all_keys(self):
         self._blob_objects = self.client_bucket.list_blobs(prefix=self.path)
@@ -476,23 +477,21 @@ class GCSProvider(StorageProvider):
         self._initialize_provider()
 
     def get_presigned_url(self, key, full=False):
+        # full paths are cached with their bucket, so that the same key in two buckets doesn't collide
+        url_key = key
         if full:
             root = _remove_protocol_from_path(key)
             split_root = root.split("/", 1)
             bucket = split_root[0]
             key = split_root[1] if len(split_root) > 1 else ""
 
-            client_bucket = self.client.get_bucket(bucket)
-        else:
-            client_bucket = self.client_bucket
-
         url = None
-        cached = self._presigned_urls.get(key)
+        cached = self._presigned_urls.get(url_key)
         if cached:
             url, t_store = cached
             t_now = time.time()
             if t_now - t_store > 3200:
-                del self._presigned_urls[key]
+                del self._presigned_urls[url_key]
                 url = None
 
         if url is None:
@@ -501,11 +500,13 @@ class GCSProvider(StorageProvider):
                 org_id, ds_name = self.tag.split("/")  # type: ignore
                 url = client.get_presigned_url(org_id, ds_name, key)
             else:
-                blob = client_bucket.get_blob(
-                    self._get_path_from_key(key) if not full else key
-                )
+                if full:
+                    # fetching the bucket is a request, only done on a cache miss
+                    blob = self.client.get_bucket(bucket).get_blob(key)
+                else:
+                    blob = self.client_bucket.get_blob(self._get_path_from_key(key))
                 url = blob.generate_signed_url(datetime.timedelta(seconds=3600))
-            self._presigned_urls[key] = (url, time.time())
+            self._presigned_urls[url_key] = (url, time.time())
         return url
 
     def get_object_size(self, key: str) -> int:
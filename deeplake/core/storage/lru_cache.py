@@ -223,13 +223,21 @@ class LRUCache(StorageProvider):
 
     def get_items(self, paths):
         """Pre-load items from next storage into cache"""
-        if self.next_storage is not None:
-            for key, result in self.next_storage.get_items(paths):
-                if isinstance(result, KeyError):
+        missing = []
+        for path in paths:
+            result = self._get_item_from_cache(path)
+            if result is None:
+                missing.append(path)
+            else:
+                yield path, result
+        if self.next_storage is not None and missing:
+            for key, result in self.next_storage.get_items(missing):
+                # failed reads are left to the regular path, which raises them
+                if isinstance(result, Exception):
                     continue
                 if _get_nbytes(result) <= self.cache_size:
                     self._insert_in_cache(key, result)
-                yield result
+                yield key, result
 
     def get_bytes(
         self,
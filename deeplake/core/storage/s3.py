@@ -600,13 +600,15 @@ class S3Provider(StorageProvider):
             bucket = self.bucket
             path = "".join((self.path, key))
 
+        # full paths are cached with their bucket, so that the same path in two buckets doesn't collide
+        url_key = key if full else path
         url = None
-        cached = self._presigned_urls.get(path)
+        cached = self._presigned_urls.get(url_key)
         if cached:
             url, t_store = cached
             t_now = time.time()
             if t_now - t_store > 3200:
-                del self._presigned_urls[path]
+                del self._presigned_urls[url_key]
                 url = None
 
         if url is None:
@@ -620,7 +622,7 @@ class S3Provider(StorageProvider):
                     Params={"Bucket": bucket, "Key": path},
                     ExpiresIn=3600,
                 )
-            self._presigned_urls[path] = (url, time.time())
+            self._presigned_urls[url_key] = (url, time.time())
         return url
 
     def get_object_size(self, path: str) -> int:
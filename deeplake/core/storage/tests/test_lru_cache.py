@@ -86,3 +86,37 @@ def test_get_bytes():
         )
 
     assert list(cache_ds.dict.keys()) == []
+
+
+def test_get_items_chained():
+    real_ds = MemoryProvider()
+    real_ds["a/five"] = bytes("12345", "utf-8")
+    real_ds["a/ten"] = bytes("1234567890", "utf-8")
+
+    local_ds = MemoryProvider()
+    local_cache = LRUCache(cache_storage=local_ds, next_storage=real_ds, cache_size=100)
+    cache_ds = MemoryProvider()
+    lru_cache = LRUCache(
+        cache_storage=cache_ds, next_storage=local_cache, cache_size=100
+    )
+
+    items = dict(lru_cache.get_items(["a/five", "a/ten", "a/missing"]))
+    assert list(items) == ["a/five", "a/ten"]
+    assert str(items["a/ten"], "utf-8") == "1234567890"
+    assert list(cache_ds.dict.keys()) == ["a/five", "a/ten"]
+    assert list(local_ds.dict.keys()) == ["a/five", "a/ten"]
+
+    # keys already held by the local tier are served from it without reading the base storage
+    cache_ds = MemoryProvider()
+    lru_cache = LRUCache(
+        cache_storage=cache_ds, next_storage=local_cache, cache_size=100
+    )
+    del real_ds["a/five"]
+    del real_ds["a/ten"]
+    real_ds["a/new"] = bytes("abc", "utf-8")
+    items = dict(lru_cache.get_items(["a/five", "a/ten", "a/new"]))
+    assert str(items["a/five"], "utf-8") == "12345"
+    assert str(items["a/ten"], "utf-8") == "1234567890"
+    assert str(items["a/new"], "utf-8") == "abc"
+    assert sorted(cache_ds.dict.keys()) == ["a/five", "a/new", "a/ten"]
+    assert sorted(local_ds.dict.keys()) == ["a/five", "a/new", "a/ten"]
@@ -1,8 +1,11 @@
 from typing import Iterator
 
+import numpy as np
+
 from deeplake.util.testing import assert_array_equal
 from deeplake.core.io import (
     IOBlock,
+    SampleStreaming,
     Streaming,
     Schedule,
     SequentialMultithreadScheduler,
@@ -28,3 +31,25 @@ def test_sequential_scheduler():
     assert_array_equal([b.indices() for b in result[1]._blocks], [[2, 6, 10]])
     assert_array_equal([b.indices() for b in result[2]._blocks], [[3, 7], [11]])
     assert_array_equal([b.indices() for b in result[3]._blocks], [[4, 8], [12]])
+
+
+def test_sample_streaming(local_ds):
+    with local_ds as ds:
+        ds.create_tensor("abc", max_chunk_size=1024, tiling_threshold=1024)
+        ds.create_tensor("xyz")
+        ds.abc.extend(np.arange(60 * 10, dtype="int32").reshape(60, 2, 5))
+        ds.abc.append(np.ones((200, 10), dtype="int32"))  # tiled sample
+        ds.xyz.extend(np.arange(61, dtype="int32"))
+
+    streaming = SampleStreaming(ds, tensors=["abc", "xyz"])
+    samples = [
+        sample
+        for block in streaming.list_blocks()
+        for sample in streaming.stream(block)
+    ]
+
+    assert [sample["index"][0] for sample in samples] == list(range(61))
+    for sample in samples:
+        idx = int(sample["index"][0])
+        np.testing.assert_array_equal(sample["abc"], ds.abc[idx].numpy())
+        np.testing.assert_array_equal(sample["xyz"], ds.xyz[idx].numpy())
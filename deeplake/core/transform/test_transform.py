@@ -15,11 +15,12 @@ from deeplake.util.exceptions import (
     AllSamplesSkippedError,
     EmptyTensorError,
     InvalidOutputDatasetError,
+    InvalidTransformDataset,
     SampleExtendingError,
     TransformError,
 )
 from deeplake.tests.common import parametrize_num_workers
-from deeplake.util.transform import get_pbar_description
+from deeplake.util.transform import get_pbar_description, transform_sample
 import deeplake
 import gc
 import re
@@ -558,6 +559,25 @@ def test_bad_transform(memory_ds):
         fn_filter().eval(ds, ds2, progressbar=False)
 
 
+
+def test_misaligned_fan_out():
+    @deeplake.compute
+    def fan_out(sample_in, samples_out):
+        for i in range(2):
+            samples_out.a.append(sample_in + i)
+            samples_out.b.append(sample_in + i)
+
+    @deeplake.compute
+    def uneven(sample_in, samples_out):
+        # first item adds two samples to a and one to b, second item adds one to b
+        if sample_in.a.numpy() == 0:
+            samples_out.a.append(0)
+            samples_out.a.append(0)
+        samples_out.b.append(sample_in.b.numpy())
+
+    with pytest.raises(InvalidTransformDataset):
+        transform_sample(0, deeplake.compose([fan_out(), uneven()]), ["a", "b"])
+
 def test_transform_persistance(local_ds_generator, num_workers=2, scheduler="threaded"):
     data_in = deeplake.dataset(
         "./test/single_transform_deeplake_dataset_htypes", overwrite=True
@@ -376,8 +376,7 @@ class Pipeline:
         )
         label_temp_tensors = {}
 
-        visible_tensors = list(target_ds.tensors)
-        visible_tensors = [target_ds[t].key for t in visible_tensors]
+        visible_tensors = [tensor.key for tensor in target_ds.tensors.values()]
 
         if not read_only:
             for tensor in class_label_tensors:
@@ -399,9 +398,13 @@ class Pipeline:
                     label_temp_tensors[tensor] = temp_tensor_obj.key
                 target_ds.flush()
 
-        tensors = list(target_ds._tensors(include_disabled=False))
-        tensors = [target_ds[t].key for t in tensors]
-        tensors = list(set(tensors) - set(class_label_tensors))
+        tensors = list(
+            {
+                tensor.key
+                for tensor in target_ds._tensors(include_disabled=False).values()
+            }
+            - set(class_label_tensors)
+        )
 
         group_index = target_ds.group_index
         version_state = target_ds.version_state
@@ -94,9 +94,8 @@ class TransformTensor:
 
     def non_numpy_only(self):
         if self.numpy_only:
-            items = list(chain(*self.items[:]))
-            self.items.clear()
-            self.items += items
+            # flattened in place in a single pass, self.items may be referenced elsewhere
+            self.items[:] = chain.from_iterable(self.items)
             self.cum_sizes.clear()
             self.numpy_only = False
 
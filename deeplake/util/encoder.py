@@ -3,6 +3,7 @@ import numpy as np
 from typing import Dict, List
 from deeplake.core.meta.encode.creds import CredsEncoder
 from deeplake.core.meta.tensor_meta import TensorMeta
+from deeplake.core.meta.encode.base_encoder import LAST_SEEN_INDEX_COLUMN
 from deeplake.core.meta.encode.chunk_id import ChunkIdEncoder
 from deeplake.core.meta.encode.tile import TileEncoder
 from deeplake.core.meta.encode.sequence import SequenceEncoder
@@ -22,58 +23,99 @@ from deeplake.util.keys import (
     get_tensor_tile_encoder_key,
 )
 import posixpath
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+from deeplake.core.storage import LocalProvider, MemoryProvider
 from deeplake.util.path import relpath
 
 
 def merge_all_meta_info(
     target_ds, storage, generated_tensors, overwrite, all_num_samples, result
 ):
-    merge_all_commit_diffs(
-        result["commit_diffs"], target_ds, storage, overwrite, generated_tensors
+    # merge steps return their items instead of writing them, so that they are written in two batches around the flush
+    items = merge_all_commit_diffs(
+        result["commit_diffs"], target_ds, overwrite, generated_tensors
     )
-    merge_all_tile_encoders(
-        result["tile_encoders"],
-        all_num_samples,
-        target_ds,
-        storage,
-        overwrite,
-        generated_tensors,
+    items.update(
+        merge_all_tile_encoders(
+            result["tile_encoders"],
+            all_num_samples,
+            target_ds,
+            overwrite,
+            generated_tensors,
+        )
     )
-    merge_all_tensor_metas(
-        result["tensor_metas"], target_ds, storage, overwrite, generated_tensors
+    write_items(storage, items)
+    target_ds.flush()
+
+    items = merge_all_tensor_metas(
+        result["tensor_metas"], target_ds, overwrite, generated_tensors
     )
-    merge_all_chunk_id_encoders(
-        result["chunk_id_encoders"], target_ds, storage, overwrite, generated_tensors
+    items.update(
+        merge_all_chunk_id_encoders(
+            result["chunk_id_encoders"], target_ds, overwrite, generated_tensors
+        )
     )
-    merge_all_creds_encoders(
-        result["creds_encoders"], target_ds, storage, overwrite, generated_tensors
+    items.update(
+        merge_all_creds_encoders(
+            result["creds_encoders"], target_ds, overwrite, generated_tensors
+        )
     )
-    merge_all_sequence_encoders(
-        result["sequence_encoders"], target_ds, storage, overwrite, generated_tensors
+    items.update(
+        merge_all_sequence_encoders(
+            result["sequence_encoders"], target_ds, overwrite, generated_tensors
+        )
     )
-    merge_all_pad_encoders(
-        result["pad_encoders"], target_ds, storage, overwrite, generated_tensors
+    items.update(
+        merge_all_pad_encoders(
+            result["pad_encoders"], target_ds, overwrite, generated_tensors
+        )
     )
     if target_ds.commit_id is not None:
-        merge_all_commit_chunk_maps(
-            result["commit_chunk_maps"],
-            target_ds,
-            storage,
-            overwrite,
-            generated_tensors,
+        items.update(
+            merge_all_commit_chunk_maps(
+                result["commit_chunk_maps"],
+                target_ds,
+                overwrite,
+                generated_tensors,
+            )
         )
+    write_items(storage, items)
+
+
+def write_items(storage: StorageProvider, items: Dict[str, bytes]) -> None:
+    """Writes all items to storage. Writes to remote storage are issued concurrently."""
+    if len(items) <= 1 or isinstance(storage, (MemoryProvider, LocalProvider)):
+        for key, value in items.items():
+            storage[key] = value
+        return
+
+    # some storage providers are not thread safe
+    storages: Dict[int, StorageProvider] = {}
+
+    def write_item(item):
+        thread_id = threading.get_ident()
+        thread_storage = storages.get(thread_id)
+        if thread_storage is None:
+            thread_storage = storages[thread_id] = storage.copy()
+        thread_storage[item[0]] = item[1]
+
+    with ThreadPoolExecutor(max_workers=min(32, len(items))) as executor:
+        # consume the results so that the first failed write is raised here
+        for _ in executor.map(write_item, items.items()):
+            pass
 
 
 def merge_all_tensor_metas(
     all_workers_tensor_metas: List[Dict[str, TensorMeta]],
     target_ds: deeplake.Dataset,
-    storage: StorageProvider,
     overwrite: bool,
     tensors: List[str],
-) -> None:
+) -> Dict[str, bytes]:
     """Merges tensor metas from all workers into a single one and stores it in target_ds."""
     commit_id = target_ds.version_state["commit_id"]
+    items: Dict[str, bytes] = {}
     for tensor in tensors:
         rel_path = relpath(tensor, target_ds.group_index)
         tensor_meta = None if overwrite else target_ds[rel_path].meta
@@ -84,7 +126,8 @@ def merge_all_tensor_metas(
             else:
                 combine_metas(tensor_meta, current_meta)
         meta_key = get_tensor_meta_key(tensor, commit_id)
-        storage[meta_key] = tensor_meta.tobytes()  # type: ignore
+        items[meta_key] = tensor_meta.tobytes()  # type: ignore
+    return items
 
 
 def combine_metas(ds_tensor_meta: TensorMeta, worker_tensor_meta: TensorMeta) -> None:
@@ -117,57 +160,65 @@ def combine_metas(ds_tensor_meta: TensorMeta, worker_tensor_meta: TensorMeta) ->
 def merge_all_chunk_id_encoders(
     all_workers_chunk_id_encoders: List[Dict[str, ChunkIdEncoder]],
     target_ds: deeplake.Dataset,
-    storage: StorageProvider,
     overwrite: bool,
     tensors: List[str],
-) -> None:
+) -> Dict[str, bytes]:
     """Merges chunk_id_encoders from all workers into a single one and stores it in target_ds."""
     commit_id = target_ds.version_state["commit_id"]
+    items: Dict[str, bytes] = {}
     for tensor in tensors:
         rel_path = relpath(tensor, target_ds.group_index)
         chunk_id_encoder = (
             None if overwrite else target_ds[rel_path].chunk_engine.chunk_id_encoder
         )
-        for current_worker_chunk_id_encoders in all_workers_chunk_id_encoders:
-            current_chunk_id_encoder = current_worker_chunk_id_encoders[tensor]
-            if chunk_id_encoder is None:
-                chunk_id_encoder = current_worker_chunk_id_encoders[tensor]
-            else:
-                combine_chunk_id_encoders(chunk_id_encoder, current_chunk_id_encoder)
+        worker_chunk_id_encoders = [
+            current_worker_chunk_id_encoders[tensor]
+            for current_worker_chunk_id_encoders in all_workers_chunk_id_encoders
+        ]
+        if chunk_id_encoder is None:
+            chunk_id_encoder = worker_chunk_id_encoders.pop(0)
+        combine_chunk_id_encoders(chunk_id_encoder, *worker_chunk_id_encoders)
 
         chunk_id_key = get_chunk_id_encoder_key(tensor, commit_id)
-        storage[chunk_id_key] = chunk_id_encoder.tobytes()  # type: ignore
+        items[chunk_id_key] = chunk_id_encoder.tobytes()  # type: ignore
+    return items
 
 
 def combine_chunk_id_encoders(
     ds_chunk_id_encoder: ChunkIdEncoder,
-    worker_chunk_id_encoder: ChunkIdEncoder,
+    *worker_chunk_id_encoders: ChunkIdEncoder,
 ) -> None:
-    """Combines the dataset's chunk_id_encoder with a single worker's chunk_id_encoder."""
-    encoded_ids = worker_chunk_id_encoder._encoded
-    if not encoded_ids.flags.writeable:
+    """Combines the dataset's chunk_id_encoder with one or more workers' chunk_id_encoders.
+    Worker encodings are shifted by the running sample count and concatenated in a single pass.
+    """
+    offset = ds_chunk_id_encoder.num_samples
+    all_encoded_ids = []
+    if ds_chunk_id_encoder._encoded.size != 0:
+        all_encoded_ids.append(ds_chunk_id_encoder._encoded)
+    for worker_chunk_id_encoder in worker_chunk_id_encoders:
+        encoded_ids = worker_chunk_id_encoder._encoded
+        if encoded_ids.size == 0:
+            continue
+        # copy so that the worker's encoder is left untouched
         encoded_ids = encoded_ids.copy()
-    if encoded_ids.size != 0:
-        offset = ds_chunk_id_encoder.num_samples
-        for encoded_id in encoded_ids:
-            encoded_id[1] += offset
-            if ds_chunk_id_encoder._encoded.size == 0:
-                ds_chunk_id_encoder._encoded = np.reshape(encoded_id, (-1, 2))
-            else:
-                ds_chunk_id_encoder._encoded = np.vstack(
-                    [ds_chunk_id_encoder._encoded, encoded_id]
-                )
+        encoded_ids[:, LAST_SEEN_INDEX_COLUMN] += offset
+        offset = int(encoded_ids[-1, LAST_SEEN_INDEX_COLUMN]) + 1
+        all_encoded_ids.append(encoded_ids)
+    if len(all_encoded_ids) == 1:
+        ds_chunk_id_encoder._encoded = all_encoded_ids[0]
+    elif all_encoded_ids:
+        ds_chunk_id_encoder._encoded = np.concatenate(all_encoded_ids, axis=0)
 
 
 def merge_all_tile_encoders(
     all_workers_tile_encoders: List[Dict[str, TileEncoder]],
     all_num_samples: List[Dict[str, int]],
     target_ds: deeplake.Dataset,
-    storage: StorageProvider,
     overwrite: bool,
     tensors: List[str],
-) -> None:
+) -> Dict[str, bytes]:
     commit_id = target_ds.version_state["commit_id"]
+    items: Dict[str, bytes] = {}
     for tensor in tensors:
         rel_path = relpath(tensor, target_ds.group_index)
         chunk_engine = target_ds[rel_path].chunk_engine
@@ -181,8 +232,8 @@ def merge_all_tile_encoders(
                 combine_tile_encoders(tile_encoder, current_tile_encoder, offset)
             offset += all_num_samples[i][tensor]
         tile_key = get_tensor_tile_encoder_key(tensor, commit_id)
-        storage[tile_key] = tile_encoder.tobytes()  # type: ignore
-    target_ds.flush()
+        items[tile_key] = tile_encoder.tobytes()  # type: ignore
+    return items
 
 
 def combine_tile_encoders(
@@ -207,12 +258,12 @@ def combine_tile_encoders(
 def merge_all_commit_chunk_maps(
     all_workers_commit_chunk_maps: List[Dict[str, CommitChunkMap]],
     target_ds: deeplake.Dataset,
-    storage: StorageProvider,
     overwrite: bool,
     tensors: List[str],
-) -> None:
+) -> Dict[str, bytes]:
     """Merges commit_chunk_maps from all workers into a single one and stores it in target_ds."""
     commit_id = target_ds.version_state["commit_id"]
+    items: Dict[str, bytes] = {}
     for tensor in tensors:
         rel_path = relpath(tensor, target_ds.group_index)
         commit_chunk_map = (
@@ -226,7 +277,8 @@ def merge_all_commit_chunk_maps(
                 combine_commit_chunk_maps(commit_chunk_map, current_commit_chunk_map)
 
         commit_chunk_key = get_tensor_commit_chunk_map_key(tensor, commit_id)
-        storage[commit_chunk_key] = commit_chunk_map.tobytes()  # type: ignore
+        items[commit_chunk_key] = commit_chunk_map.tobytes()  # type: ignore
+    return items
 
 
 def combine_commit_chunk_maps(
@@ -240,12 +292,12 @@ def combine_commit_chunk_maps(
 def merge_all_commit_diffs(
     all_workers_commit_diffs: List[Dict[str, CommitDiff]],
     target_ds: deeplake.Dataset,
-    storage: StorageProvider,
     overwrite: bool,
     tensors: List[str],
-) -> None:
+) -> Dict[str, bytes]:
     """Merges commit_diffs from all workers into a single one and stores it in target_ds."""
     commit_id = target_ds.version_state["commit_id"]
+    items: Dict[str, bytes] = {}
     for tensor in tensors:
         rel_path = relpath(tensor, target_ds.group_index)  # type: ignore
         commit_diff = None if overwrite else target_ds[rel_path].chunk_engine.commit_diff  # type: ignore
@@ -258,7 +310,8 @@ def merge_all_commit_diffs(
                 combine_commit_diffs(commit_diff, current_commit_diff)
 
         commit_chunk_key = get_tensor_commit_diff_key(tensor, commit_id)
-        storage[commit_chunk_key] = commit_diff.tobytes()  # type: ignore
+        items[commit_chunk_key] = commit_diff.tobytes()  # type: ignore
+    return items
 
 
 def combine_commit_diffs(
@@ -271,11 +324,11 @@ def combine_commit_diffs(
 def merge_all_creds_encoders(
     all_workers_creds_encoders: List[Dict[str, CredsEncoder]],
     target_ds: deeplake.Dataset,
-    storage: StorageProvider,
     overwrite: bool,
     tensors: List[str],
-) -> None:
+) -> Dict[str, bytes]:
     commit_id = target_ds.version_state["commit_id"]
+    items: Dict[str, bytes] = {}
     for tensor in tensors:
         rel_path = relpath(tensor, target_ds.group_index)
         actual_tensor = target_ds[rel_path]
@@ -291,7 +344,8 @@ def merge_all_creds_encoders(
                 combine_creds_encoders(creds_encoder, current_creds_encoder)
 
         creds_key = get_creds_encoder_key(tensor, commit_id)
-        storage[creds_key] = creds_encoder.tobytes()  # type: ignore
+        items[creds_key] = creds_encoder.tobytes()  # type: ignore
+    return items
 
 
 def combine_creds_encoders(
@@ -299,23 +353,27 @@ def combine_creds_encoders(
 ) -> None:
     """Combines the dataset's creds_encoder with a single worker's creds_encoder."""
     arr = worker_creds_encoder.array
-    num_entries = len(arr)
-    last_index = -1
-    for i in range(num_entries):
-        next_last_index = arr[i][1]
-        num_samples = next_last_index - last_index
-        ds_creds_encoder.register_samples((arr[i][0],), num_samples)
-        last_index = next_last_index
+    if len(arr) == 0:
+        return
+    arr = arr.copy()
+    arr[:, LAST_SEEN_INDEX_COLUMN] += ds_creds_encoder.num_samples
+    encoded = ds_creds_encoder._encoded
+    if len(encoded) != 0:
+        arr = np.concatenate([encoded, arr], axis=0)
+    # consecutive rows with the same creds key collapse into the last one, same as register_samples
+    keep = np.append(arr[1:, 0] != arr[:-1, 0], True)
+    ds_creds_encoder._encoded = arr[keep]
+    ds_creds_encoder.is_dirty = True
 
 
 def merge_all_sequence_encoders(
     all_workers_sequence_encoders: List[Dict[str, SequenceEncoder]],
     target_ds: deeplake.Dataset,
-    storage: StorageProvider,
     overwrite: bool,
     tensors: List[str],
-) -> None:
+) -> Dict[str, bytes]:
     commit_id = target_ds.version_state["commit_id"]
+    items: Dict[str, bytes] = {}
     for tensor in tensors:
         rel_path = relpath(tensor, target_ds.group_index)
         actual_tensor = target_ds[rel_path]
@@ -332,7 +390,8 @@ def merge_all_sequence_encoders(
                 combine_sequence_encoders(sequence_encoder, current_sequence_encoder)
 
         sequence_key = get_sequence_encoder_key(tensor, commit_id)
-        storage[sequence_key] = sequence_encoder.tobytes()  # type: ignore
+        items[sequence_key] = sequence_encoder.tobytes()  # type: ignore
+    return items
 
 
 def combine_sequence_encoders(
@@ -370,11 +429,11 @@ def combine_pad_encoders(
 def merge_all_pad_encoders(
     all_workers_pad_encoders: List[Dict[str, PadEncoder]],
     target_ds: deeplake.Dataset,
-    storage: StorageProvider,
     overwrite: bool,
     tensors: List[str],
-) -> None:
+) -> Dict[str, bytes]:
     commit_id = target_ds.version_state["commit_id"]
+    items: Dict[str, bytes] = {}
     for tensor in tensors:
         rel_path = relpath(tensor, target_ds.group_index)
         actual_tensor = target_ds[rel_path]
@@ -387,4 +446,5 @@ def merge_all_pad_encoders(
                 pad_encoder = combine_pad_encoders(pad_encoder, current_pad_encoder)
 
         pad_key = get_pad_encoder_key(tensor, commit_id)
-        storage[pad_key] = pad_encoder.tobytes()  # type: ignore
+        items[pad_key] = pad_encoder.tobytes()  # type: ignore
+    return items
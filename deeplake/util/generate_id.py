@@ -1,6 +1,6 @@
-from uuid import uuid4
+import os
 
 
 def generate_id(dtype: type):
-    shift = 128 - (8 * dtype(1).itemsize)
-    return dtype(uuid4().int >> shift)
+    # draw exactly as many random bytes as the id needs instead of truncating a uuid4
+    return dtype(int.from_bytes(os.urandom(dtype(1).itemsize), "big"))
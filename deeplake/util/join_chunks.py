@@ -4,12 +4,22 @@ from typing import List
 def join_chunks(chunks: List[bytes], start_byte: int, end_byte: int) -> bytes:
     if len(chunks) == 1:
         return memoryview(chunks[0])[start_byte:end_byte]
-    b = bytearray()
+    last = len(chunks) - 1
+    views = []
     for i, chunk in enumerate(chunks):
         actual_start_byte, actual_end_byte = 0, len(chunk)
         if i <= 0:
             actual_start_byte = start_byte
-        if i >= len(chunks) - 1:
+        if i >= last:
             actual_end_byte = end_byte
-        b += chunk[actual_start_byte:actual_end_byte]
+        views.append(memoryview(chunk)[actual_start_byte:actual_end_byte])
+
+    # preallocate the output so each chunk is copied exactly once
+    b = bytearray(sum(map(len, views)))
+    out = memoryview(b)
+    offset = 0
+    for view in views:
+        n = len(view)
+        out[offset : offset + n] = view
+        offset += n
     return b
@@ -854,8 +854,13 @@ def _merge_tile_encoders(
     src_tile_encoder, dest_tile_encoder, start: int, end: int
 ) -> None:
     src_entries = src_tile_encoder.entries
+    # tiled samples are sparse, walk the entries instead of probing every index in the range
+    if len(src_entries) < end - start:
+        indices = sorted(i for i in src_entries if start <= i < end)
+    else:
+        indices = range(start, end)  # type: ignore
     dest_entries = dest_tile_encoder.entries
-    for i in range(start, end):
+    for i in indices:
         e = src_entries.get(i)
         if e:
             dest_entries[i] = e
@@ -0,0 +1,9 @@
+from deeplake.util.join_chunks import join_chunks
+
+
+def test_join_chunks():
+    chunks = [b"abcdef", b"ghij", b"klmnop"]
+    assert bytes(join_chunks(chunks, 2, 3)) == b"cdefghijklm"
+    assert bytes(join_chunks(chunks, 0, 6)) == b"abcdefghijklmnop"
+    assert bytes(join_chunks(chunks[:1], 1, 4)) == b"bcd"
+    assert bytes(join_chunks([b"abc", b"def"], 3, 0)) == b""
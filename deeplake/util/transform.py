@@ -65,32 +65,32 @@ def transform_sample(
         transform_fn = pipeline.functions[index]
         fn, args, kwargs = transform_fn.func, transform_fn.args, transform_fn.kwargs
 
+        result = TransformDataset(tensors)
         if isinstance(out, TransformDataset):
-            result = TransformDataset(tensors)
             for item in out:
                 fn(item, result, *args, **kwargs)
                 validate_transform_dataset(result)
-            out = result
         else:
-            result = TransformDataset(tensors)
             fn(out, result, *args, **kwargs)
             validate_transform_dataset(result)
-            out = result
+        out = result
     return out
 
 
 def validate_transform_dataset(dataset: TransformDataset):
     """Checks if the length of all the tensors is equal. Raises exception if not equal."""
-    data = dataset.data
-    lengths = [
-        len(data[tensor])
-        for tensor in data
-        if (not data[tensor].is_group and len(data[tensor]) > 0)
-    ]
-    if any(length != lengths[0] for length in lengths):
-        raise InvalidTransformDataset(
-            "The number of samples added to each tensor in transform should be the same."
-        )
+    expected = 0
+    for tensor in dataset.data.values():
+        if tensor.is_group:
+            continue
+        length = len(tensor)
+        if length == 0 or length == expected:
+            continue
+        if expected:
+            raise InvalidTransformDataset(
+                "The number of samples added to each tensor in transform should be the same."
+            )
+        expected = length
 
 
 def is_empty_transform_dataset(dataset: TransformDataset):